@@ -2,57 +2,105 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import hashlib
+import importlib.util
+import json
 import os
 import re
 import sys
-import textwrap
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from html import unescape
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
 
-import pdfplumber
-from pypdf import PdfReader, PdfWriter
-from reportlab.lib.pagesizes import LETTER
-from reportlab.pdfgen import canvas as rl_canvas
-
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-
-try:
-    import arabic_reshaper
-    from bidi.algorithm import get_display
-    HAVE_ARABIC_TOOLS = True
-except ImportError:
-    HAVE_ARABIC_TOOLS = False
-
-import sys
+if TYPE_CHECKING:
+    from pypdf import PdfReader
 
 if sys.version_info < (3, 10):
     raise RuntimeError("Ustadh Humoyun, please use Python +3.10!")
 
 
+# Heavy PDF/font/Arabic deps are imported on first use (not at startup: keeps --help and cached runs fast)
+@functools.lru_cache(maxsize=1)
+def _pdf_deps():
+    from pypdf import PdfReader, PdfWriter
+    return PdfReader, PdfWriter
+
+@functools.lru_cache(maxsize=1)
+def _pdfplumber():
+    import pdfplumber
+    return pdfplumber
+
+@functools.lru_cache(maxsize=1)
+def _reportlab_deps():
+    from reportlab.lib.pagesizes import LETTER
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.pdfgen import canvas as rl_canvas
+    return LETTER, pdfmetrics, TTFont, rl_canvas
+
+@functools.lru_cache(maxsize=1)
+def _arabic_deps():
+    # (reshape, get_display), or None if the optional Arabic tools aren't installed
+    try:
+        import arabic_reshaper
+        from bidi.algorithm import get_display
+    except ImportError:
+        return None
+    return arabic_reshaper.reshape, get_display
+
+
 ARABIC_RE = re.compile(r"[\u0600-\u06FF]")
 
 def contains_arabic(s: str) -> bool:
-    return bool(ARABIC_RE.search(s or ""))
+    # Most values (dates, URLs, English labels) are pure ASCII: answer those without running the regex
+    if not s or s.isascii():
+        return False
+    return bool(ARABIC_RE.search(s))
 
+@functools.lru_cache(maxsize=None)
 def shape_rtl_arabic(s: str) -> str:
     # Arabic needs shaping + bidi reordering for correct display in PDFs
     # If tools aren't available, return original (but we will avoid rendering Arabic then)
-    if not HAVE_ARABIC_TOOLS:
+    # Cached: the same strings (e.g. AUTHORITY_AR) are shaped for every sermon
+    deps = _arabic_deps()
+    if deps is None:
         return s
-    reshaped = arabic_reshaper.reshape(s)
+    reshape, get_display = deps
+    reshaped = reshape(s)
     return get_display(reshaped)
 
 def wrap_text(s: str, width: int) -> list[str]:
-    # Simple wrapper preserving your old wrapping logic
-    return textwrap.wrap(s, width=width) if s else [""]
+    # Greedy word wrap (same idea as textwrap.wrap, without its regex tokenizer/TextWrapper per call)
+    if not s:
+        return [""]
+    out, line = [], ""
+    for w in s.split():
+        # Tokens longer than a line (URLs have no spaces) are hard-sliced
+        while len(w) > width:
+            if line:
+                out.append(line)
+                line = ""
+            out.append(w[:width])
+            w = w[width:]
+        if not w:
+            continue
+        if line and len(line) + len(w) + 1 > width:
+            out.append(line)
+            line = w
+        else:
+            line = f"{line} {w}" if line else w
+    if line:
+        out.append(line)
+    return out
 
 LIST_URL = (
     "https://awqaf.gov.jo/AR/Pages/%D8%AE%D8%B7%D8%A8_%D8%A7%D9%84%D8%AC%D9%85%D8%B9%D8%A9"
@@ -65,6 +113,35 @@ AUTHORITY_EN = "Ministry of Awqaf and Islamic Affairs and Holy Places (Jordan)"
 AUTHORITY_AR = "وزارة الأوقاف والشؤون والمقدسات الإسلامية - الأردن"
 
 DATE_RE = re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})\.pdf$", re.IGNORECASE)
+# We only need href values from the listing, so a regex over the raw HTML replaces a full parse.
+# Earlier attributes are skipped as whole quoted values (so `title="a>b"` doesn't end the tag),
+# `(?<![\w-])` keeps `data-href=` from matching, and the value may be "double", 'single' or unquoted.
+# Unlike an HTML parser, <a> tags inside comments/<script> are not ignored (then filtered by .pdf + date like the rest).
+HREF_RE = re.compile(
+    r"""<a\b(?:[^>"']|"[^"]*"|'[^']*')*?(?<![\w-])href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE,
+)
+
+# manifest.csv columns (in order)
+MANIFEST_FIELDS = (
+    "country",
+    "issuing_authority_en",
+    "issuing_authority_ar",
+    "date_gregorian",
+    "title_extracted",
+    "source_url",
+    "local_filename",
+    "sha256",
+    "pages_total",
+    "retrieved_at_utc",
+)
+
+# Patterns used per sermon, compiled once
+PAREN_TITLE_RE = re.compile(r"\)\s*([^()]{3,200}?)\s*\(")
+TITLE_HEADER_RE = re.compile(r"عنوان\s+خطبة\s+الجمعة\s+الموحد")
+WHITESPACE_RE = re.compile(r"\s+")
+# Characters that break Windows/macOS filesystems (deleted with str.translate)
+BAD_FS_CHARS = str.maketrans("", "", '\\/:"*?<>|')
 
 
 @dataclass
@@ -74,14 +151,39 @@ class SermonLink:
     inferred_title: str      # extracted from PDF (preferred) or fallback
 
 
-def _requests_session() -> requests.Session:
-    s = requests.Session()
-    s.headers.update({
-        "User-Agent": "Mozilla/5.0 (compatible; RA-assignment-scraper/1.0; +https://example.com)",
-        "Accept": "text/html,application/pdf;q=0.9,*/*;q=0.8",
-        "Accept-Language": "ar,en;q=0.8",
-    })
-    return s
+def _http_client() -> httpx.Client:
+    # HTTP/2 multiplexes all requests to the same host over one connection (needs the optional 'h2' package);
+    # without it httpx falls back to a pool of HTTP/1.1 keep-alive connections
+    return httpx.Client(
+        http2=importlib.util.find_spec("h2") is not None,
+        headers={
+            "User-Agent": "Mozilla/5.0 (compatible; RA-assignment-scraper/1.0; +https://example.com)",
+            "Accept": "text/html,application/pdf;q=0.9,*/*;q=0.8",
+            "Accept-Language": "ar,en;q=0.8",
+        },
+        timeout=60.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+    )
+
+
+def _date_from_pdf_href(href: str) -> Optional[Tuple[int, int, int]]:
+    """
+    (day, month, year) from a filename ending in _d-m-yyyy.pdf, or None.
+    The common layout is parsed with plain string splitting; DATE_RE is only the fallback for other stems.
+    """
+    stem = href[:-4].rsplit("/", 1)[-1]
+    parts = stem.rsplit("_", 1)[-1].split("-")
+    if (
+        len(parts) == 3
+        and all(p.isdecimal() for p in parts)
+        and len(parts[0]) <= 2 and len(parts[1]) <= 2 and len(parts[2]) == 4
+    ):
+        return int(parts[0]), int(parts[1]), int(parts[2])
+    m = DATE_RE.search(href)
+    if not m:
+        return None
+    return int(m.group(1)), int(m.group(2)), int(m.group(3))
 
 
 def parse_listing_for_year(html: str, year: int) -> List[Tuple[str, str]]:
@@ -89,44 +191,159 @@ def parse_listing_for_year(html: str, year: int) -> List[Tuple[str, str]]:
     Returns list of (date_iso, pdf_url) from the listing page for a given year.
     Strategy: collect all hrefs ending in .pdf and parse Gregorian date from filename suffix _d-m-yyyy.pdf.
     """
-    soup = BeautifulSoup(html, "lxml")
-    links = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
+    # Single pass: deduplicate by date while scanning (keep first occurrence)
+    dedup: Dict[str, str] = {}
+    for m_href in HREF_RE.finditer(html):
+        href = unescape(m_href.group(1) or m_href.group(2) or m_href.group(3) or "").strip()
         if not href.lower().endswith(".pdf"):
             continue
-        full = urljoin(LIST_URL, href)
-        m = DATE_RE.search(full)
-        if not m:
+        date = _date_from_pdf_href(href)
+        if not date:
             continue
-        d, mth, y = int(m.group(1)), int(m.group(2)), int(m.group(3))
+        d, mth, y = date
         if y != year:
             continue
         date_iso = f"{y:04d}-{mth:02d}-{d:02d}"
-        links.append((date_iso, full))
+        if date_iso not in dedup:
+            # urljoin only for links we actually keep
+            dedup[date_iso] = urljoin(LIST_URL, href)
 
-    # Deduplicate by date (keep first occurrence)
-    dedup = {}
-    for date_iso, url in links:
-        dedup.setdefault(date_iso, url)
+    return sorted(dedup.items())
 
-    out = sorted(dedup.items(), key=lambda x: x[0])
-    return out
+
+class HashingWriter:
+    """
+    File wrapper that feeds every written byte into a hashlib object,
+    so the hash is computed while writing instead of re-reading the file afterwards.
+    """
+
+    def __init__(self, f, hasher) -> None:
+        self._f = f
+        self._hasher = hasher
+
+    def write(self, data) -> int:
+        self._hasher.update(data)
+        return self._f.write(data)
+
+    def __getattr__(self, name):
+        # tell(), flush(), ... go to the real file (pypdf needs tell() for xref offsets)
+        return getattr(self._f, name)
 
 
-def download_file(session: requests.Session, url: str, path: Path, sleep_seconds: float = 0.5) -> None:
+def _request_headers(url: str) -> Optional[Dict[str, str]]:
+    # PDFs are already compressed, so don't ask the server to gzip them again
+    # (same headers for HEAD and GET, so their validators are comparable)
+    return {"Accept-Encoding": "identity"} if url.lower().endswith(".pdf") else None
+
+
+def _fingerprint(headers: httpx.Headers) -> Dict[str, str]:
+    # Validators we can compare between runs (empty dict means "unknown")
+    fp = {}
+    for header in ("ETag", "Last-Modified", "Content-Length"):
+        if headers.get(header):
+            fp[header] = headers[header]
+    return fp
+
+
+def download_file(client: httpx.Client, url: str, path: Path, sleep_seconds: float = 0.5, hasher=None) -> Dict[str, str]:
+    """
+    Stream `url` to `path` (feeding `hasher` if given).
+    Returns the response's fingerprint, so a fresh download needs no extra HEAD request.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with session.get(url, stream=True, timeout=60) as r:
+    with client.stream("GET", url, headers=_request_headers(url)) as r:
         r.raise_for_status()
         with open(path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024 * 64):
-                if chunk:
-                    f.write(chunk)
+            out = HashingWriter(f, hasher) if hasher else f
+            for chunk in r.iter_bytes(chunk_size=1024 * 1024):
+                out.write(chunk)
+        return _fingerprint(r.headers)
+
+
+class RateLimiter:
+    """
+    Spaces out request starts by at least `interval` seconds across all threads,
+    so the politeness delay stays global even when downloads run in parallel.
+    With interval 0 it is a no-op (concurrency is then only bounded by the thread pool size).
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = max(interval, 0.0)
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+
+def remote_fingerprint(client: httpx.Client, url: str) -> Dict[str, str]:
+    """
+    Cheap HEAD request returning the validators we can compare between runs.
+    Empty dict means "unknown" (request failed or server sent no validators).
+    """
+    try:
+        r = client.head(url, headers=_request_headers(url), timeout=30.0)
+        r.raise_for_status()
+    except httpx.HTTPError:
+        return {}
+    return _fingerprint(r.headers)
+
+
+def fetch_all(
+    client: httpx.Client,
+    pairs: List[Tuple[str, str]],
+    originals_dir: Path,
+    url_cache: Dict[str, dict],
+    *,
+    workers: int = 8,
+    sleep_seconds: float = 0.0,
+) -> Dict[str, Tuple[Path, bool, str]]:
+    """
+    Download all original PDFs in parallel through the shared client, hashing them while they stream to disk.
+    PDFs that already exist locally and have a `url_cache` entry are checked with a HEAD request first and
+    not re-downloaded if the fingerprint still matches. Every request (HEAD or GET) goes through the rate limiter.
+    Returns {date_iso: (local_path, downloaded, sha256 of the original)} and updates `url_cache` in place.
+    """
+    limiter = RateLimiter(sleep_seconds)
+
+    def _fetch(pair: Tuple[str, str]) -> Tuple[str, str, Path, bool, Dict[str, str], str]:
+        date_iso, pdf_url = pair
+        path = originals_dir / f"{date_iso}.pdf"
+        cached = url_cache.get(pdf_url) or {}
+        if path.exists() and cached.get("fingerprint"):
+            limiter.wait()
+            fp = remote_fingerprint(client, pdf_url)
+            if fp and cached["fingerprint"] == fp:
+                return date_iso, pdf_url, path, False, fp, cached.get("sha256") or sha256_file(path)
+        limiter.wait()
+        h = hashlib.sha256()
+        fp = download_file(client, pdf_url, path, hasher=h)
+        return date_iso, pdf_url, path, True, fp, h.hexdigest()
+
+    out = {}
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as ex:
+        for date_iso, pdf_url, path, downloaded, fp, original_sha in ex.map(_fetch, pairs):
+            out[date_iso] = (path, downloaded, original_sha)
+            if fp:
+                url_cache[pdf_url] = {"fingerprint": fp, "sha256": original_sha}
+            else:
+                url_cache.pop(pdf_url, None)
+    return out
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with open(path, "rb") as f:
+        # Python 3.11+: hashing loop runs in C (and releases the GIL)
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
     return h.hexdigest()
@@ -138,9 +355,13 @@ def extract_title_from_pdf(pdf_path: Path) -> Optional[str]:
     Many Jordan PDFs include a line like:
       "عنوان خطبة الجمعة الموحد )TITLE("
     Note RTL parentheses can appear reversed.
+    Uses pdfplumber on purpose: the regexes below are tuned to its (visually ordered) text,
+    pypdf's logical-order output makes them pick the header instead of the title.
     """
     try:
-        with pdfplumber.open(str(pdf_path)) as pdf:
+        pdfplumber = _pdfplumber()
+        # pages=[1] (1-indexed): only page 1 is wrapped/parsed, no layout work for the rest of the document
+        with pdfplumber.open(str(pdf_path), pages=[1]) as pdf:
             if not pdf.pages:
                 return None
             text = pdf.pages[0].extract_text() or ""
@@ -152,12 +373,12 @@ def extract_title_from_pdf(pdf_path: Path) -> Optional[str]:
         return None
 
     # Try pattern: ) TITLE (
-    candidates = re.findall(r"\)\s*([^()]{3,200}?)\s*\(", text)
+    candidates = PAREN_TITLE_RE.findall(text)
     if candidates:
         # Choose the first candidate that contains Arabic letters or looks like a real title
         for c in candidates:
             c2 = c.strip()
-            if re.search(r"[\u0600-\u06FF]", c2) or len(c2) >= 8:
+            if ARABIC_RE.search(c2) or len(c2) >= 8:
                 return c2
 
     # Fallback: look for word "عنوان" and take subsequent words
@@ -165,7 +386,7 @@ def extract_title_from_pdf(pdf_path: Path) -> Optional[str]:
     if idx != -1:
         tail = text[idx: idx + 300]
         # remove common header words
-        tail = re.sub(r"عنوان\s+خطبة\s+الجمعة\s+الموحد", "", tail).strip()
+        tail = TITLE_HEADER_RE.sub("", tail).strip()
         tail = tail.strip(":-–— ")
         if len(tail) >= 8:
             return tail[:120]
@@ -175,61 +396,56 @@ def extract_title_from_pdf(pdf_path: Path) -> Optional[str]:
 
 def sanitize_filename_component(s: str, max_len: int = 90) -> str:
     s = s.strip()
-    s = re.sub(r"\s+", " ", s)
+    s = WHITESPACE_RE.sub(" ", s)
     # Remove characters that break Windows/macOS filesystems
-    s = re.sub(r'[\\/:"*?<>|]+', "", s)
+    s = s.translate(BAD_FS_CHARS)
     s = s.strip(" .")
     if len(s) > max_len:
         s = s[:max_len].rstrip()
     return s or "untitled"
 
 
-def make_cover_pdf(
-    cover_path: Path,
-    *,
-    date_iso: str,
-    title: str,
-    source_url: str,
-    retrieved_at: str,
-) -> None:
-    """
-    Create a 1-page cover PDF with required metadata inside the PDF.
-    Preserves the original layout, but renders Arabic correctly using an embedded TTF font.
-    """
-    cover_path.parent.mkdir(parents=True, exist_ok=True)
-    c = rl_canvas.Canvas(str(cover_path), pagesize=LETTER)
-    width, height = LETTER
+@functools.lru_cache(maxsize=1)
+def _get_canvas_font() -> Optional[str]:
+    # Register Arabic font if present (lazily, once per process: TTFont objects can't be pickled to workers)
+    font_path = Path(__file__).resolve().parent / "fonts" / "Amiri-Regular.ttf"
+    if not (font_path.exists() and _arabic_deps() is not None):
+        return None
+    _, pdfmetrics, TTFont, _ = _reportlab_deps()
+    if "Amiri" not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(TTFont("Amiri", str(font_path)))
+    return "Amiri"
 
-    left = 54
-    y = height - 72
-    line_h = 14
-    value_x = left + 140
-    value_right_x = width - left
 
-    # Register Arabic font if present
-    arabic_font_name = None
-    font_path = Path(__file__).resolve().parent / "fonts" / "Amiri-Regular.ttf"
-    if font_path.exists() and HAVE_ARABIC_TOOLS:
-        arabic_font_name = "Amiri"
-        pdfmetrics.registerFont(TTFont(arabic_font_name, str(font_path)))
+COVER_LEFT = 54
+COVER_LINE_H = 14
+COVER_NOTE = (
+    "Note: I always prioritize beauty and conciseness. I didn't want to put long ugly label with all information. Thus, I created additional meta-page that provides all details before you dive into the khutbah! Hope you like it ;)"
+)
+
 
+def _draw_cover_header(c, pagesize) -> float:
+    _, height = pagesize
+    y = height - 72
     c.setFont("Helvetica-Bold", 14)
-    c.drawString(left, y, "Friday Sermon (Khutbah) | For Ustadh Humoyun | By Oybek Abdukhalimov")
-    y -= 2 * line_h
+    c.drawString(COVER_LEFT, y, "Friday Sermon (Khutbah) | For Ustadh Humoyun | By Oybek Abdukhalimov")
+    y -= 2 * COVER_LINE_H
 
     c.setFont("Helvetica", 11)
+    return y
 
-    issuing_value = f"{AUTHORITY_EN} / {AUTHORITY_AR}"
-    fields = [
-        ("Country", COUNTRY),
-        ("Issuing authority", issuing_value),
-        ("Sermon date (Gregorian)", date_iso),
-        ("Sermon title (extracted)", title),
-        ("Source URL", source_url),
-        ("Retrieved at", retrieved_at),
-    ]
 
-    for k, v in fields:
+def _draw_cover_fields(c, pagesize, y: float, fields: List[Tuple[str, str]], arabic_font_name: Optional[str]) -> float:
+    width, height = pagesize
+    left = COVER_LEFT
+    line_h = COVER_LINE_H
+    value_x = left + 140
+    value_right_x = width - left
+
+    # Scan each value for Arabic once, not once per branch
+    values = [(k, v, contains_arabic(v)) for k, v in fields]
+
+    for k, v, v_is_arabic in values:
         c.setFont("Helvetica-Bold", 11)
         c.drawString(left, y, f"{k}:")
         y -= 0  # keep your spacing behavior
@@ -263,7 +479,7 @@ def make_cover_pdf(
             continue
 
         # General rendering: Arabic values use Arabic font + RTL shaping (no squares)
-        if arabic_font_name and contains_arabic(v):
+        if arabic_font_name and v_is_arabic:
             c.setFont(arabic_font_name, 12)
             for line in wrap_text(v, width=70):
                 c.drawRightString(value_right_x, y, shape_rtl_arabic(line))
@@ -274,7 +490,7 @@ def make_cover_pdf(
                     y = height - 72
         else:
             # If Arabic font isn't available, avoid printing Arabic characters (prevents squares)
-            if not arabic_font_name and contains_arabic(v):
+            if not arabic_font_name and v_is_arabic:
                 v = "[Arabic text omitted: font not available]"
 
             c.setFont("Helvetica", 11)
@@ -288,21 +504,56 @@ def make_cover_pdf(
 
         y -= 6
 
+    return y
+
+
+def _draw_cover_note(c, y: float) -> None:
     c.setFont("Helvetica-Oblique", 10)
-    note = (
-        "Note: I always prioritize beauty and conciseness. I didn't want to put long ugly label with all information. Thus, I created additional meta-page that provides all details before you dive into the khutbah! Hope you like it ;)"
-    )
-    for line in wrap_text(note, width=110):
-        c.drawString(left, y, line)
-        y -= line_h
+    for line in wrap_text(COVER_NOTE, width=110):
+        c.drawString(COVER_LEFT, y, line)
+        y -= COVER_LINE_H
+
+
+def make_cover_pdf(
+    cover_path: Path,
+    *,
+    date_iso: str,
+    title: str,
+    source_url: str,
+    retrieved_at: str,
+) -> None:
+    """
+    Create a 1-page cover PDF with required metadata inside the PDF.
+    Preserves the original layout, but renders Arabic correctly using an embedded TTF font.
+    """
+    cover_path.parent.mkdir(parents=True, exist_ok=True)
+    LETTER, _, _, rl_canvas = _reportlab_deps()
+    c = rl_canvas.Canvas(str(cover_path), pagesize=LETTER)
+
+    arabic_font_name = _get_canvas_font()
+
+    issuing_value = f"{AUTHORITY_EN} / {AUTHORITY_AR}"
+    fields = [
+        ("Country", COUNTRY),
+        ("Issuing authority", issuing_value),
+        ("Sermon date (Gregorian)", date_iso),
+        ("Sermon title (extracted)", title),
+        ("Source URL", source_url),
+        ("Retrieved at", retrieved_at),
+    ]
+
+    y = _draw_cover_header(c, LETTER)
+    y = _draw_cover_fields(c, LETTER, y, fields, arabic_font_name)
+    _draw_cover_note(c, y)
 
     c.showPage()
     c.save()
 
 
-def merge_cover_with_original(cover_pdf: Path, original_pdf: Path, out_pdf: Path) -> int:
+def merge_cover_with_original(cover_pdf: Path, original_pdf: Union[Path, PdfReader], out_pdf: Path, hasher=None) -> int:
+    PdfReader, PdfWriter = _pdf_deps()
     reader_cover = PdfReader(str(cover_pdf))
-    reader_orig = PdfReader(str(original_pdf))
+    reader_orig = original_pdf if isinstance(original_pdf, PdfReader) else PdfReader(str(original_pdf))
     writer = PdfWriter()
 
     for p in reader_cover.pages:
@@ -312,21 +563,29 @@ def merge_cover_with_original(cover_pdf: Path, original_pdf: Path, out_pdf: Path
 
     out_pdf.parent.mkdir(parents=True, exist_ok=True)
     with open(out_pdf, "wb") as f:
-        writer.write(f)
+        writer.write(HashingWriter(f, hasher) if hasher else f)
 
     return len(reader_cover.pages) + len(reader_orig.pages)
 
 
-def write_manifest_csv(rows: List[dict], path: Path) -> None:
+def load_manifest_csv(path: Path) -> Dict[str, dict]:
+    # Previous run's manifest keyed by sermon date (empty if there is none yet)
+    if not path.exists():
+        return {}
+    with open(path, newline="", encoding="utf-8") as f:
+        return {row["date_gregorian"]: row for row in csv.DictReader(f)}
+
+
+def load_json_cache(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_json_cache(cache: dict, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    if not rows:
-        return
-    fieldnames = list(rows[0].keys())
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+    path.write_text(json.dumps(cache, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
 def build_zip(out_dir: Path, zip_path: Path) -> None:
@@ -335,82 +594,71 @@ def build_zip(out_dir: Path, zip_path: Path) -> None:
     with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
         for p in out_dir.rglob("*"):
             if p.is_file():
-                z.write(p, arcname=p.relative_to(out_dir))
+                # PDFs are already deflate-compressed inside; store them as-is, only compress text files
+                compress_type = zipfile.ZIP_STORED if p.suffix.lower() == ".pdf" else zipfile.ZIP_DEFLATED
+                z.write(p, arcname=p.relative_to(out_dir), compress_type=compress_type)
 
 
-def main() -> int:
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--year", type=int, default=2025, help="Gregorian year (e.g., 2025)")
-    ap.add_argument("--out", type=str, default="out_jordan", help="Output directory")
-    ap.add_argument("--sleep", type=float, default=0.5, help="Delay between downloads (seconds)")
-    ap.add_argument("--zip-name", type=str, default="", help="Optional ZIP filename (default auto)")
-    args = ap.parse_args()
-
-    year = args.year
-    out_dir = Path(args.out).resolve()
-    originals_dir = out_dir / "original_pdfs"
-    final_dir = out_dir / "pdfs"
-    docs_dir = out_dir / "docs"
-
-    session = _requests_session()
-    resp = session.get(LIST_URL, timeout=60)
-    resp.raise_for_status()
-
-    pairs = parse_listing_for_year(resp.text, year)
-    if len(pairs) < 50:
-        print(f"[WARN] Found {len(pairs)} PDFs for {year}. Check the listing page or year.", file=sys.stderr)
-
-    manifest_rows = []
-    retrieved_at = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
-
-    for date_iso, pdf_url in pairs:
-        # Download original
-        tmp_pdf = originals_dir / f"{date_iso}.pdf"
-        download_file(session, pdf_url, tmp_pdf, sleep_seconds=args.sleep)
-
-        # Extract title
-        title = extract_title_from_pdf(tmp_pdf)
-        if not title:
-            # fallback from URL filename (remove date suffix)
-            base = Path(pdf_url).name
-            base = re.sub(DATE_RE, "", base)
-            base = base.replace("_", " ")
-            title = base.strip() or "untitled"
-        title_clean = sanitize_filename_component(title)
-
-        # Cover + merge
-        cover_pdf = out_dir / "tmp" / f"cover_{date_iso}.pdf"
-        make_cover_pdf(
-            cover_pdf,
-            date_iso=date_iso,
-            title=title,
-            source_url=pdf_url,
-            retrieved_at=retrieved_at,
-        )
-
-        out_pdf = final_dir / f"{date_iso} - {title_clean}.pdf"
-        total_pages = merge_cover_with_original(cover_pdf, tmp_pdf, out_pdf)
-
-        # Manifest row
-        manifest_rows.append({
-            "country": COUNTRY,
-            "issuing_authority_en": AUTHORITY_EN,
-            "issuing_authority_ar": AUTHORITY_AR,
-            "date_gregorian": date_iso,
-            "title_extracted": title,
-            "source_url": pdf_url,
-            "local_filename": str(out_pdf.relative_to(out_dir)).replace("\\", "/"),
-            "sha256": sha256_file(out_pdf),
-            "pages_total": total_pages,
-            "retrieved_at_utc": retrieved_at,
-        })
-
-        print(f"[OK] {date_iso} | {title_clean}")
-
-    write_manifest_csv(manifest_rows, out_dir / "manifest.csv")
+def process_one(
+    date_iso: str,
+    pdf_url: str,
+    original_pdf: Path,
+    original_sha: str,
+    out_dir: Path,
+    retrieved_at: str,
+    title_cache: Dict[str, str],
+) -> Tuple[dict, Optional[str]]:
+    """
+    Title extraction + cover + merge for a single sermon (runs inside a worker process).
+    Returns (manifest_row, extracted title or None) so the parent can update its title cache.
+    """
+    # Extract title (cached by hash of the original, so re-covering reuses prior titles)
+    extracted = title_cache.get(original_sha) or extract_title_from_pdf(original_pdf)
+    # The original is parsed with pypdf once, for the merge
+    PdfReader, _ = _pdf_deps()
+    reader_orig = PdfReader(str(original_pdf))
+    title = extracted
+    if not title:
+        # fallback from URL filename (remove date suffix)
+        base = Path(pdf_url).name
+        base = DATE_RE.sub("", base)
+        base = base.replace("_", " ")
+        title = base.strip() or "untitled"
+    title_clean = sanitize_filename_component(title)
+
+    # Cover + merge
+    cover_pdf = out_dir / "tmp" / f"cover_{date_iso}.pdf"
+    make_cover_pdf(
+        cover_pdf,
+        date_iso=date_iso,
+        title=title,
+        source_url=pdf_url,
+        retrieved_at=retrieved_at,
+    )
 
-    # Write brief 1-page documentation stub
-    doc_text = f"""RA Assignment — Friday Sermon Corpus (Jordan, {year})
+    out_pdf = out_dir / "pdfs" / f"{date_iso} - {title_clean}.pdf"
+    # Hash the merged file while it is written (no second read from disk)
+    merged_hash = hashlib.sha256()
+    total_pages = merge_cover_with_original(cover_pdf, reader_orig, out_pdf, hasher=merged_hash)
+
+    # Manifest row
+    row = {
+        "country": COUNTRY,
+        "issuing_authority_en": AUTHORITY_EN,
+        "issuing_authority_ar": AUTHORITY_AR,
+        "date_gregorian": date_iso,
+        "title_extracted": title,
+        "source_url": pdf_url,
+        "local_filename": str(out_pdf.relative_to(out_dir)).replace("\\", "/"),
+        "sha256": merged_hash.hexdigest(),
+        "pages_total": total_pages,
+        "retrieved_at_utc": retrieved_at,
+    }
+    return row, extracted
+
+
+# Brief 1-page documentation stub (filled in with str.format at the end of main)
+DOC_TEMPLATE = """RA Assignment — Friday Sermon Corpus (Jordan, {year})
 
 Country chosen: Jordan
 Issuing authority: {AUTHORITY_EN} / {AUTHORITY_AR}
@@ -454,7 +702,7 @@ Challenges & solutions (what broke, and how I fixed it):
    - Solution: sanitize titles to remove forbidden characters and trim length while keeping the filename meaningful.
 
 5) Reproducibility + respectful scraping behavior :)
-   - Solution: use a single requests session with clear headers and an optional delay; keep everything parameterized (year/output folder); log outputs via manifest + hashes.
+   - Solution: use a single HTTP client session with clear headers and an optional delay; keep everything parameterized (year/output folder); log outputs via manifest + hashes.
 
 How to reproduce:
 - Python 3.10+ (tested locally)
@@ -467,6 +715,106 @@ Outputs:
 - manifest.csv: metadata + sha256 hashes
 - docs/documentation.txt: this file
 """
+
+
+def _positive_int(value: str) -> int:
+    # argparse type: reject 0/negative counts up front, not after all downloads have finished
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be an integer, got {value!r}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return n
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--year", type=int, default=2025, help="Gregorian year (e.g., 2025)")
+    ap.add_argument("--out", type=str, default="out_jordan", help="Output directory")
+    ap.add_argument(
+        "--sleep", type=float, default=0.0,
+        help="Minimum gap between request starts across all threads, in seconds (default 0: only --workers limits "
+             "the load; N PDFs take at least N x SLEEP seconds otherwise)",
+    )
+    ap.add_argument("--workers", type=_positive_int, default=8, help="Parallel download threads (max concurrent requests)")
+    ap.add_argument("--jobs", type=_positive_int, default=None, help="Worker processes for cover/merge (default: CPU count)")
+    ap.add_argument("--zip-name", type=str, default="", help="Optional ZIP filename (default auto)")
+    args = ap.parse_args()
+
+    year = args.year
+    out_dir = Path(args.out).resolve()
+    originals_dir = out_dir / "original_pdfs"
+    docs_dir = out_dir / "docs"
+
+    retrieved_at = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+
+    # Incremental mode: remember remote fingerprints + extracted titles between runs
+    cache_path = out_dir / ".cache.json"
+    cache = load_json_cache(cache_path)
+    url_cache = cache.setdefault("urls", {})
+    title_cache = cache.setdefault("titles", {})
+    previous_rows = load_manifest_csv(out_dir / "manifest.csv")
+
+    with _http_client() as client:
+        resp = client.get(LIST_URL)
+        resp.raise_for_status()
+
+        pairs = parse_listing_for_year(resp.text, year)
+        if len(pairs) < 50:
+            print(f"[WARN] Found {len(pairs)} PDFs for {year}. Check the listing page or year.", file=sys.stderr)
+
+        # Download all originals first (network-bound), then process them (CPU-bound)
+        originals = fetch_all(client, pairs, originals_dir, url_cache, workers=args.workers, sleep_seconds=args.sleep)
+
+    # Save fingerprints right away, so a crash during processing doesn't force re-downloads
+    save_json_cache(cache, cache_path)
+
+    # Title extraction + cover + merge is CPU-bound and independent per sermon -> process pool.
+    # Manifest rows are written (in date order) as soon as each sermon is done, so a crash keeps finished work.
+    manifest_path = out_dir / "manifest.csv"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # Workers register the Arabic font once at start-up instead of on their first cover
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_get_canvas_font) as ex, open(manifest_path, "w", newline="", encoding="utf-8") as mf:
+        writer = csv.DictWriter(mf, fieldnames=MANIFEST_FIELDS)
+        writer.writeheader()
+
+        jobs = {}
+        for date_iso, pdf_url in pairs:
+            tmp_pdf, downloaded, original_sha = originals[date_iso]
+
+            # Unchanged source + already merged output -> reuse the previous manifest row
+            prev = previous_rows.get(date_iso)
+            if not downloaded and prev and prev.get("source_url") == pdf_url and (out_dir / prev["local_filename"]).exists():
+                jobs[date_iso] = prev
+                continue
+            jobs[date_iso] = ex.submit(
+                process_one, date_iso, pdf_url, tmp_pdf, original_sha, out_dir, retrieved_at, title_cache
+            )
+
+        for date_iso, job in jobs.items():
+            if isinstance(job, dict):
+                row = job
+                print(f"[SKIP] {date_iso} | unchanged")
+            else:
+                row, extracted_title = job.result()
+                if extracted_title:
+                    _, _, original_sha = originals[date_iso]
+                    title_cache[original_sha] = extracted_title
+                print(f"[OK] {date_iso} | {sanitize_filename_component(row['title_extracted'])}")
+
+            writer.writerow(row)
+            mf.flush()
+
+    save_json_cache(cache, cache_path)
+
+    # Write brief 1-page documentation stub
+    doc_text = DOC_TEMPLATE.format(
+        year=year,
+        AUTHORITY_EN=AUTHORITY_EN,
+        AUTHORITY_AR=AUTHORITY_AR,
+        LIST_URL=LIST_URL,
+    )
     docs_dir.mkdir(parents=True, exist_ok=True)
     (docs_dir / "documentation.txt").write_text(doc_text, encoding="utf-8")
 